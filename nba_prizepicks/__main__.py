@@ -1,8 +1,10 @@
 """Entry point for NBA PrizePicks Predictor."""
 
 import sys
+import logging
 import typer
 from rich.console import Console
+from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.text import Text
 
@@ -27,8 +29,14 @@ def main():
 
 
 @app.command()
-def run(compare_prizepicks: bool = typer.Option(False, "--compare", "-c", help="Compare predictions with live PrizePicks lines")):
+def run(
+    compare_prizepicks: bool = typer.Option(False, "--compare", "-c", help="Compare predictions with live PrizePicks lines"),
+    debug: bool = typer.Option(False, "--debug", help="Show debug logging, including scraper tracebacks"),
+):
     """Run the NBA PrizePicks Predictor dashboard."""
+    if debug:
+        logging.basicConfig(level=logging.DEBUG, format="%(message)s", handlers=[RichHandler(console=console)])
+    
     try:
         dashboard = Dashboard()
         
@@ -36,7 +44,7 @@ def run(compare_prizepicks: bool = typer.Option(False, "--compare", "-c", help="
         if compare_prizepicks:
             console.print("[bold yellow]Starting with PrizePicks comparisons enabled[/]")
             dashboard.compare_with_prizepicks = True
-            dashboard.prizepicks = dashboard.prizepicks.__class__(use_sample_data=False)
+            dashboard.prizepicks = dashboard.prizepicks.__class__(use_sample_data=False, debug=debug)
         else:
             console.print("[bold green]Starting in predictions-only mode[/]")
         
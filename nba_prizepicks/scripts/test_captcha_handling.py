@@ -21,7 +21,7 @@ def test_captcha_handling():
     
     # Create a PrizePicks data handler with sample data disabled (force live scraping)
     console.print("[blue]Initializing PrizePicks data handler...[/]")
-    pp_data = PrizePicksData(use_sample_data=False)
+    pp_data = PrizePicksData(use_sample_data=False, debug=True)
     
     # Create a data directory for storing screenshots if it doesn't exist
     os.makedirs("data/prizepicks", exist_ok=True)
@@ -21,7 +21,7 @@ def test_manual_captcha_solving():
     
     # Create a PrizePicks data handler with sample data disabled and manual CAPTCHA enabled
     console.print("[blue]Initializing PrizePicks data handler with manual CAPTCHA mode...[/]")
-    pp_data = PrizePicksData(use_sample_data=False, manual_captcha=True)
+    pp_data = PrizePicksData(use_sample_data=False, manual_captcha=True, debug=True)
     
     # Create a data directory for storing screenshots if it doesn't exist
     os.makedirs("data/prizepicks", exist_ok=True)
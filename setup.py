@@ -26,6 +26,8 @@ setup(
         "scraper": [
             "requests-html>=0.10.0",
             "lxml_html_clean>=1.0.0",
+            "orjson>=3.9.0",
+            "brotli>=1.1.0",
         ],
         "tests": [
             "pytest>=7.4.3",
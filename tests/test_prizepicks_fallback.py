@@ -2,9 +2,11 @@
 
 import os
 import json
+import threading
+import time
 import pytest
 from unittest.mock import patch, MagicMock
-from nba_prizepicks.utils.prizepicks import PrizePicksData
+from nba_prizepicks.utils.prizepicks import PrizePicksData, _widen_connection_pool, _ensure_chromedriver, _match_prop_type
 
 # Create test directory
 os.makedirs("test_data/prizepicks", exist_ok=True)
@@ -61,7 +63,7 @@ def test_robust_get_player_line(prizepicks_handler):
     assert line is None
     
     # Test with exception during processing
-    with patch.object(prizepicks_handler, 'get_todays_lines', side_effect=Exception("Test error")):
+    with patch.object(prizepicks_handler, '_todays_lines', side_effect=Exception("Test error")):
         line = prizepicks_handler.get_player_line("Test Player", "Points")
         assert line is None
 
@@ -77,7 +79,7 @@ def test_robust_get_player_lines(prizepicks_handler):
     assert lines == []
     
     # Test with exception during processing
-    with patch.object(prizepicks_handler, 'get_todays_lines', side_effect=Exception("Test error")):
+    with patch.object(prizepicks_handler, '_todays_lines', side_effect=Exception("Test error")):
         lines = prizepicks_handler.get_player_lines("Test Player")
         assert lines == []
 
@@ -126,4 +128,724 @@ def test_prizepicks_always_returns_data():
                 # Verify we get at least one emergency data line
                 assert lines is not None
                 assert len(lines) > 0
-                assert "player_name" in lines[0] 
\ No newline at end of file
+                assert "player_name" in lines[0] 
+
+
+def test_sample_data_checked_once_per_process(tmp_path):
+    """Test that later handlers skip the sample file check entirely."""
+    data_dir = str(tmp_path)
+    sample_file = f"{data_dir}/prizepicks/sample_data.json"
+    PrizePicksData(data_dir=data_dir, use_sample_data=True)
+    assert os.path.exists(sample_file)
+    
+    with patch('os.stat', wraps=os.stat) as mock_stat:
+        PrizePicksData(data_dir=data_dir, use_sample_data=True)
+        stat_paths = [call.args[0] for call in mock_stat.call_args_list]
+        assert sample_file not in stat_paths
+
+
+def test_sample_db_seeded_lazily_once_per_process(tmp_path):
+    """Test that handlers don't touch SQLite until queried, and seed the sample rows only once."""
+    data_dir = str(tmp_path)
+    import sqlite3
+    
+    with patch('nba_prizepicks.utils.prizepicks.sqlite3.connect', wraps=sqlite3.connect) as mock_connect:
+        first = PrizePicksData(data_dir=data_dir, use_sample_data=True)
+        mock_connect.assert_not_called()
+        assert first.get_lines()
+        assert mock_connect.call_count == 2
+        
+        second = PrizePicksData(data_dir=data_dir, use_sample_data=True)
+        assert second.get_lines() == first.get_lines()
+        # Only the queries themselves connected
+        assert mock_connect.call_count == 4
+
+
+def test_sample_data_read_once_per_handler(tmp_path):
+    """Test that repeated sample fallbacks are served from memory until a forced refresh."""
+    handler = PrizePicksData(data_dir=str(tmp_path), use_sample_data=True)
+    first = handler._get_sample_data()
+    
+    with patch('os.path.getmtime', wraps=os.path.getmtime) as mock_getmtime:
+        assert handler._get_sample_data() == first
+        mock_getmtime.assert_not_called()
+        
+        handler.get_todays_lines(force_refresh=True)
+        assert mock_getmtime.call_count == 1
+
+
+def test_cookies_saved_atomically(tmp_path):
+    """Test that saved cookies replace the file in one step and load in a new handler."""
+    handler = PrizePicksData(data_dir=str(tmp_path), use_sample_data=True)
+    handler.session.cookies.set("cf_clearance", "token")
+    handler._save_cookies()
+    
+    assert not os.path.exists(f"{handler.cookies_file}.tmp")
+    reloaded = PrizePicksData(data_dir=str(tmp_path), use_sample_data=True)
+    assert reloaded.session.cookies.get("cf_clearance") == "token"
+
+
+def test_find_captcha_element_uses_single_query(prizepicks_handler):
+    """Test that the CAPTCHA selector list is matched and its text checked in one browser call."""
+    button = MagicMock()
+    driver = MagicMock()
+    driver.execute_script.return_value = [button, "Press & Hold"]
+    
+    element = prizepicks_handler._find_captcha_element(driver, PrizePicksData._CAPTCHA_SELECTORS)
+    
+    assert element is button
+    assert driver.execute_script.call_count == 1
+    driver.find_elements.assert_not_called()
+    _, css_selector, xpath_selector, _ = driver.execute_script.call_args.args
+    assert ".px-captcha-error-button, div.px-captcha-error-button" in css_selector
+    assert "//div[text()='Press & Hold'] | " in xpath_selector
+
+
+def test_captcha_detection_uses_single_query(prizepicks_handler):
+    """Test that CAPTCHA detection and the no-CAPTCHA path take one browser call."""
+    driver = MagicMock()
+    driver.execute_script.return_value = {"hold": None, "checkbox": False, "frame": False, "text": False}
+    
+    with patch('time.sleep'):
+        assert prizepicks_handler._handle_captcha(driver) is False
+    assert driver.execute_script.call_count == 1
+    driver.find_elements.assert_not_called()
+    driver.switch_to.frame.assert_not_called()
+    
+    for found in (True, False):
+        driver.execute_script.return_value = found
+        assert prizepicks_handler._detect_any_captcha(
+            driver, PrizePicksData._CAPTCHA_SELECTORS, PrizePicksData._RECAPTCHA_SELECTORS
+        ) is found
+    assert driver.execute_script.call_count == 3
+    driver.find_elements.assert_not_called()
+
+
+def test_manual_captcha_waits_until_detection_clears(prizepicks_handler):
+    """Test that manual solving keeps waiting while any detected CAPTCHA signal remains."""
+    driver = MagicMock()
+    with patch.object(prizepicks_handler, '_detect_any_captcha', side_effect=[True, True, False]) as mock_detect, \
+         patch.object(prizepicks_handler, '_save_screenshot'), \
+         patch('nba_prizepicks.utils.prizepicks.selectors.DefaultSelector') as mock_selector, \
+         patch('nba_prizepicks.utils.prizepicks.time.sleep'):
+        mock_selector.return_value.select.return_value = []
+        driver.execute_script.return_value = "complete"
+        assert prizepicks_handler._handle_manual_captcha(driver) is True
+    assert mock_detect.call_count == 3
+    driver.find_elements.assert_not_called()
+
+
+def test_manual_captcha_skips_stdin_poll_on_windows(prizepicks_handler):
+    """Test that console input is not polled where select() only supports sockets."""
+    driver = MagicMock()
+    driver.execute_script.return_value = "complete"
+    with patch.object(prizepicks_handler, '_detect_any_captcha', return_value=False), \
+         patch.object(prizepicks_handler, '_save_screenshot'), \
+         patch('nba_prizepicks.utils.prizepicks.selectors.DefaultSelector') as mock_selector, \
+         patch('nba_prizepicks.utils.prizepicks.sys.platform', 'win32'):
+        assert prizepicks_handler._handle_manual_captcha(driver) is True
+    mock_selector.assert_not_called()
+    
+    # A selector whose select() fails is dropped instead of ending the wait with an error
+    with patch.object(prizepicks_handler, '_detect_any_captcha', side_effect=[True, False]), \
+         patch.object(prizepicks_handler, '_save_screenshot'), \
+         patch('nba_prizepicks.utils.prizepicks.selectors.DefaultSelector') as mock_selector, \
+         patch('nba_prizepicks.utils.prizepicks.sys.stdin') as mock_stdin, \
+         patch('nba_prizepicks.utils.prizepicks.time.sleep'):
+        mock_stdin.isatty.return_value = True
+        mock_selector.return_value.select.side_effect = OSError(10038, "not a socket")
+        assert prizepicks_handler._handle_manual_captcha(driver) is True
+    assert mock_selector.return_value.select.call_count == 1
+
+
+def test_captcha_handlers_gated_on_probe(prizepicks_handler):
+    """Test that only the handlers matching what the probe saw are run, and frames are skipped without a hint."""
+    driver = MagicMock()
+    with patch.object(prizepicks_handler, '_handle_press_and_hold_captcha', return_value=False) as mock_hold, \
+         patch.object(prizepicks_handler, '_handle_checkbox_captcha', return_value=False) as mock_checkbox:
+        driver.execute_script.return_value = {"hold": None, "checkbox": True, "frame": False, "text": False}
+        prizepicks_handler._handle_captcha(driver)
+        mock_hold.assert_not_called()
+        mock_checkbox.assert_called_once()
+        
+        driver.execute_script.return_value = {"hold": MagicMock(), "checkbox": False, "frame": False, "text": False}
+        prizepicks_handler._handle_captcha(driver)
+        assert mock_hold.call_args.kwargs["has_captcha_hint"] is False
+        
+        # CAPTCHA wording with no widget on the page may mean the widget is in a frame
+        driver.execute_script.return_value = {"hold": None, "checkbox": False, "frame": False, "text": True}
+        prizepicks_handler._handle_captcha(driver)
+        assert mock_hold.call_count == 2
+        assert mock_hold.call_args.kwargs["has_captcha_hint"] is True
+        assert mock_checkbox.call_count == 3
+    
+    driver = MagicMock()
+    driver.execute_script.return_value = [None, ""]
+    assert prizepicks_handler._handle_press_and_hold_captcha(
+        driver, PrizePicksData._CAPTCHA_SELECTORS, has_captcha_hint=False
+    ) is False
+    assert driver.execute_script.call_count == 1
+    driver.switch_to.frame.assert_not_called()
+
+
+def test_checkbox_captcha_returns_once_ticked(prizepicks_handler):
+    """Test that the checkbox handler waits on the ticked state rather than a fixed pause."""
+    driver = MagicMock()
+    driver.execute_script.return_value = True
+    iframe = {"element": MagicMock(), "src": "https://www.google.com/recaptcha/api2/anchor", "title": "reCAPTCHA", "id": ""}
+    
+    with patch.object(prizepicks_handler, '_scan_iframes', return_value=[iframe]), \
+         patch.object(prizepicks_handler, '_find_visible_elements', return_value=[MagicMock()]), \
+         patch.object(prizepicks_handler, '_check_for_image_challenge') as mock_challenge, \
+         patch('nba_prizepicks.utils.prizepicks.webdriver.ActionChains') as mock_chains, \
+         patch('time.sleep') as mock_sleep:
+        assert prizepicks_handler._handle_checkbox_captcha(driver, PrizePicksData._RECAPTCHA_SELECTORS) is True
+    
+    mock_chains.assert_called_once_with(driver, duration=0)
+    mock_challenge.assert_not_called()
+    assert all(call.args[0] < 2 for call in mock_sleep.call_args_list)
+
+
+def test_live_lines_cached_and_revalidated(tmp_path, sample_data):
+    """Test that live lines are cached and refreshed in the background once stale."""
+    prizepicks_handler = PrizePicksData(data_dir=str(tmp_path))
+    with patch.object(prizepicks_handler, '_scrape_prizepicks_data', return_value=sample_data) as mock_scrape:
+        prizepicks_handler.get_todays_lines()
+        prizepicks_handler.get_todays_lines()
+        assert mock_scrape.call_count == 1
+        
+        # Age the cache past the fresh window but within the stale window
+        prizepicks_handler._cache["fetched_at"] -= prizepicks_handler.caching_ttl + 1
+        with patch('threading.Thread') as mock_thread:
+            lines = prizepicks_handler.get_todays_lines()
+            mock_thread.assert_called_once_with(target=prizepicks_handler._background_refresh, daemon=True)
+            
+            # A foreground scrape finishing meanwhile doesn't allow a second background refresh
+            prizepicks_handler.get_todays_lines(force_refresh=True)
+            prizepicks_handler._cache["fetched_at"] -= prizepicks_handler.caching_ttl + 1
+            prizepicks_handler.get_todays_lines()
+            assert mock_thread.call_count == 1
+        assert lines[0]["player_name"] == "Test Player"
+        
+        # The flag is cleared once the background refresh itself is done
+        prizepicks_handler._background_refresh()
+        assert prizepicks_handler._refreshing is False
+
+
+def test_player_lookups_use_index(prizepicks_handler, sample_data):
+    """Test that player lookups are case-insensitive and index each lines list once."""
+    lines = sample_data + [dict(sample_data[0], projection_type="Assists", line=5.5)]
+    
+    with patch.object(prizepicks_handler, '_todays_lines', return_value=lines):
+        assert prizepicks_handler.get_player_line("test player", "assists")["line"] == 5.5
+        index = prizepicks_handler._lines_index
+        assert prizepicks_handler.get_player_lines("TEST PLAYER") == lines
+    
+    # The second lookup reused the index built for the same lines
+    assert prizepicks_handler._lines_index is index
+
+
+def test_returned_lines_are_callers_own(tmp_path):
+    """Test that changing returned lines doesn't change what later calls see."""
+    handler = PrizePicksData(data_dir=str(tmp_path), use_sample_data=True)
+    lines = handler.get_todays_lines()
+    original = dict(lines[0])
+    lines[0]["line"] = -1
+    lines.append({"player_name": "Extra"})
+    
+    again = handler.get_todays_lines()
+    assert again[0] == original
+    assert len(again) == len(lines) - 1
+    
+    handler.get_player_line(original["player_name"], original["projection_type"])["line"] = -1
+    assert handler.get_todays_lines()[0] == original
+
+
+def test_failed_scrape_not_retried_per_lookup(tmp_path):
+    """Test that sample lines served after a failed scrape are reused for later lookups."""
+    handler = PrizePicksData(data_dir=str(tmp_path))
+    
+    with patch.object(handler, '_scrape_prizepicks_data', return_value=[]) as scrape:
+        handler.get_player_line("Ja Morant", "Points")
+        handler.get_player_lines("LeBron James")
+        assert scrape.call_count == 1
+        
+        handler.get_todays_lines(force_refresh=True)
+        assert scrape.call_count == 2
+
+
+def test_saved_lines_reused_across_handlers(tmp_path, sample_data):
+    """Test that a recent scrape on disk is reused until it expires or a refresh is forced."""
+    first = PrizePicksData(data_dir=str(tmp_path))
+    with patch.object(first, '_scrape_prizepicks_data', return_value=sample_data):
+        first.get_todays_lines()
+    
+    second = PrizePicksData(data_dir=str(tmp_path))
+    with patch.object(second, '_scrape_prizepicks_data', return_value=[]) as mock_scrape:
+        lines = second.get_todays_lines()
+        assert mock_scrape.call_count == 0
+        assert lines[0]["player_name"] == "Test Player"
+        
+        second.get_todays_lines(force_refresh=True)
+        assert mock_scrape.call_count == 1
+    
+    # Expired files are ignored
+    third = PrizePicksData(data_dir=str(tmp_path))
+    third.cache_ttl_seconds = 0
+    with patch.object(third, '_scrape_prizepicks_data', return_value=[]) as mock_scrape:
+        third.get_todays_lines()
+        assert mock_scrape.call_count == 1
+
+
+def test_driver_pool_reuses_browsers(prizepicks_handler):
+    """Test that released browsers are reused and broken ones are discarded."""
+    driver = MagicMock()
+    with patch('nba_prizepicks.utils.prizepicks.webdriver.Chrome', return_value=driver) as mock_chrome:
+        with prizepicks_handler._pooled_driver(options=MagicMock()) as first:
+            pass
+        with prizepicks_handler._pooled_driver(options=MagicMock()) as second:
+            pass
+        assert first is second
+        assert mock_chrome.call_count == 1
+        blocked = [call.args[1]["urls"] for call in driver.execute_cdp_cmd.call_args_list
+                   if call.args[0] == "Network.setBlockedURLs"]
+        assert len(blocked) == 1 and "*google-analytics.com*" in blocked[0]
+        
+        with pytest.raises(RuntimeError):
+            with prizepicks_handler._pooled_driver(options=MagicMock()):
+                raise RuntimeError("page crashed")
+        driver.quit.assert_called_once()
+        assert prizepicks_handler._driver_pool.empty()
+
+
+def test_driver_pool_recycles_worn_out_browsers(prizepicks_handler):
+    """Test that a browser is quit once it has served max_uses_per_driver scrapes."""
+    prizepicks_handler.max_uses_per_driver = 2
+    drivers = [MagicMock(), MagicMock()]
+    with patch('nba_prizepicks.utils.prizepicks.webdriver.Chrome', side_effect=drivers):
+        for _ in range(3):
+            with prizepicks_handler._pooled_driver(options=MagicMock()):
+                pass
+    
+    drivers[0].quit.assert_called_once()
+    drivers[1].quit.assert_not_called()
+    assert prizepicks_handler._driver_pool.get_nowait() is drivers[1]
+
+
+def test_pooled_browsers_quit_when_handler_collected(tmp_path):
+    """Test that idle pooled browsers are quit once their handler is garbage collected."""
+    import gc
+    
+    handler = PrizePicksData(data_dir=str(tmp_path))
+    driver = MagicMock()
+    with patch('nba_prizepicks.utils.prizepicks.webdriver.Chrome', return_value=driver):
+        with handler._pooled_driver(options=MagicMock()):
+            pass
+    driver.quit.assert_not_called()
+    
+    del handler
+    gc.collect()
+    driver.quit.assert_called_once()
+
+
+def test_close_finishes_pending_writes(tmp_path):
+    """Test that close waits for queued background writes and stops the writer thread."""
+    handler = PrizePicksData(data_dir=str(tmp_path), use_sample_data=True)
+    driver = MagicMock()
+    driver.get_screenshot_as_png.return_value = b"png"
+    path = tmp_path / "shot.png"
+    
+    handler._save_screenshot(driver, str(path))
+    handler.close()
+    
+    assert path.read_bytes() == b"png"
+    with pytest.raises(RuntimeError):
+        handler._io_pool.submit(print)
+
+
+def test_widen_connection_pool():
+    """Test that a driver's command connection pool is rebuilt with a larger size."""
+    import urllib3
+    
+    manager = urllib3.PoolManager()
+    manager.connection_from_url("http://localhost:9515")
+    driver = MagicMock()
+    driver.command_executor._conn = manager
+    
+    assert _widen_connection_pool(driver, maxsize=20) is driver
+    assert manager.connection_from_url("http://localhost:9515").pool.maxsize == 20
+
+
+def test_chrome_setup_done_once_per_process(prizepicks_handler):
+    """Test that chromedriver is installed and options are built only once."""
+    _ensure_chromedriver.cache_clear()
+    with patch('nba_prizepicks.utils.prizepicks.chromedriver_autoinstaller.install',
+               return_value="/usr/bin/chromedriver") as install:
+        first = prizepicks_handler._configure_chrome_options()
+        second = prizepicks_handler._configure_chrome_options()
+    _ensure_chromedriver.cache_clear()
+    
+    assert install.call_count == 1
+    assert first is second
+    assert "--headless=new" in first.arguments
+
+
+def test_selenium_skipped_without_chromedriver(prizepicks_handler):
+    """Test that browser scraping gives up at once, without retries, when Chrome is missing."""
+    _ensure_chromedriver.cache_clear()
+    with patch('nba_prizepicks.utils.prizepicks.chromedriver_autoinstaller.install',
+               side_effect=ValueError("No chrome executable found on PATH")), \
+         patch.object(prizepicks_handler, '_acquire_driver') as mock_acquire, \
+         patch('time.sleep') as mock_sleep:
+        assert prizepicks_handler._selenium_scraping() == []
+    _ensure_chromedriver.cache_clear()
+    
+    mock_acquire.assert_not_called()
+    mock_sleep.assert_not_called()
+
+
+def test_projections_batch_split_across_workers(prizepicks_handler):
+    """Test that a batch is split into contiguous chunks and merged back in order."""
+    import concurrent.futures
+    
+    urls = [f"https://app.prizepicks.com/?day={day}" for day in range(5)]
+    scraped = []
+    start_methods = []
+    sample_modes = []
+    
+    def fake_process_pool(max_workers, mp_context=None):
+        start_methods.append(mp_context.get_start_method())
+        return concurrent.futures.ThreadPoolExecutor(max_workers)
+    
+    def fake_scrape_many(self, chunk, max_workers=4, grid_url=None):
+        sample_modes.append(self.use_sample_data)
+        scraped.append(list(chunk))
+        return [{"url": url} for url in chunk]
+    
+    with patch('concurrent.futures.ProcessPoolExecutor', fake_process_pool), \
+         patch.object(PrizePicksData, '_scrape_many', fake_scrape_many), \
+         patch('nba_prizepicks.utils.prizepicks.CLOUDFLARE_BYPASS_AVAILABLE', True), \
+         patch.object(PrizePicksData, '_start_cloudflare_bypass_server') as mock_bypass:
+        projections = prizepicks_handler.get_projections_batch(urls, workers=2)
+    
+    assert sorted(scraped) == [urls[:3], urls[3:]]
+    assert [p["url"] for p in projections] == urls
+    assert start_methods == ["spawn"]
+    
+    # Workers scrape live pages without starting a bypass server of their own
+    assert sample_modes == [False, False]
+    mock_bypass.assert_not_called()
+
+
+def test_prop_type_matched_by_keyword_rank():
+    """Test that the highest-ranked keyword names the prop wherever it appears in the text."""
+    assert _match_prop_type("last 10 games: points") == "Points"
+    assert _match_prop_type("rebounds 11.5") == "Rebounds"
+    assert _match_prop_type("pts+reb+ast") == "PRA"
+    assert _match_prop_type("lebron james") is None
+
+
+def test_captcha_timings_reproducible_with_seed(tmp_path):
+    """Test that handlers with the same captcha_seed draw the same CAPTCHA timings."""
+    with patch.object(PrizePicksData, 'captcha_seed', 7):
+        first = PrizePicksData(data_dir=str(tmp_path), use_sample_data=True)
+        second = PrizePicksData(data_dir=str(tmp_path), use_sample_data=True)
+    
+    draws = [[rng.uniform(9.5, 10.5), rng.randint(-5, 5), rng.randint(-3, 3)]
+             for rng in (first._captcha_rng, second._captcha_rng)]
+    assert draws[0] == draws[1]
+    assert 9.5 <= draws[0][0] <= 10.5
+
+
+def test_lines_stored_and_queried_by_player(tmp_path):
+    """Test that scraped lines go to SQLite and can be read back per player."""
+    handler = PrizePicksData(data_dir=str(tmp_path))
+    
+    # Before anything is scraped, the sample lines are served
+    assert handler.get_lines("Ja Morant")[0]["line"] == 24.0
+    
+    scraped = [
+        {"player_name": "Test Player", "team": "TST", "opponent": "OPP",
+         "projection_type": "Points", "line": 20.5, "game_time": "2023-11-15T19:30:00"},
+        {"player_name": "Other Player", "team": "OTH", "opponent": "TST",
+         "projection_type": "Assists", "line": 6.5, "game_time": "2023-11-15T19:30:00"},
+    ]
+    handler._store_lines(scraped)
+    
+    assert len(handler.get_lines()) == 2
+    assert handler.get_lines("test player") == [scraped[0]]
+    
+    df = handler.get_projections_df()
+    assert list(df.columns) == ["player_name", "team", "opponent", "projection_type", "line", "game_time"]
+    assert sorted(df["line"]) == [6.5, 20.5]
+    
+    # A later scrape replaces the stored slate instead of adding to it
+    later = [dict(scraped[0], line=21.5, game_time="2023-11-15T20:00:00")]
+    handler._store_lines(later)
+    assert handler.get_lines() == later
+
+
+def test_projections_df_holds_latest_scrape_only(tmp_path):
+    """Test that scrapes stamped with their scrape time don't pile up in the DataFrame."""
+    handler = PrizePicksData(data_dir=str(tmp_path))
+    scrapes = [
+        [{"player_name": "Test Player", "team": "TST", "opponent": "OPP",
+          "projection_type": "Points", "line": line, "game_time": stamp},
+         {"player_name": "Other Player", "team": "OTH", "opponent": "TST",
+          "projection_type": "Assists", "line": 6.5, "game_time": stamp}]
+        for line, stamp in ((20.5, "2023-11-15T10:00:00"), (21.5, "2023-11-15T10:05:00"))
+    ]
+    
+    with patch.object(handler, '_scrape_prizepicks_data', side_effect=scrapes):
+        handler._refresh_lines()
+        handler._refresh_lines()
+    
+    df = handler.get_projections_df()
+    assert not df.duplicated(["player_name", "projection_type"]).any()
+    assert sorted(df["line"]) == [6.5, 21.5]
+    assert set(df["game_time"]) == {"2023-11-15T10:05:00"}
+
+
+def test_process_api_data(prizepicks_handler):
+    """Test that JSON:API projections are flattened with their included player names."""
+    data = {
+        "data": [
+            {"id": "1", "type": "projection",
+             "attributes": {"line": 24.5, "stat_type": "Points", "start_time": "2023-11-15T19:30:00"},
+             "relationships": {"player": {"data": {"id": "p1"}}}},
+            {"id": "2", "type": "league", "attributes": {"name": "NBA"}},
+            {"id": "3", "type": "projection",
+             "attributes": {"value": "6.5", "name": "Other Player", "type": "Assists"}},
+        ],
+        "included": [{"id": "p1", "attributes": {"name": "Test Player"}}],
+    }
+    
+    projections = prizepicks_handler._process_api_data(data)
+    
+    assert len(projections) == 2
+    assert projections[0] == {
+        "player_name": "Test Player", "team": "Unknown", "opponent": "Unknown",
+        "projection_type": "Points", "line": 24.5, "game_time": "2023-11-15T19:30:00"
+    }
+    assert projections[1]["player_name"] == "Other Player"
+    assert projections[1]["projection_type"] == "Assists"
+    assert projections[1]["line"] == 6.5
+
+
+def test_api_endpoints_fetched_concurrently(tmp_path):
+    """Test that API endpoints are requested in parallel and merged in order."""
+    handler = PrizePicksData(data_dir=str(tmp_path))
+    barrier = threading.Barrier(2, timeout=5)
+    
+    def fake_get(url, **kwargs):
+        response = MagicMock(status_code=404)
+        if "filter[league_id]=7" in url or "filter[sport]=NBA" in url:
+            # Both requests must be in flight at once to get past the barrier
+            barrier.wait()
+            name = "First Player" if "league_id" in url else "Second Player"
+            response.status_code = 200
+            response.content = json.dumps({"data": [{
+                "type": "projection",
+                "attributes": {"name": name, "stat_type": "Points", "line": 20.5},
+            }]}).encode()
+        return response
+    
+    with patch.object(handler.session, 'get', side_effect=fake_get):
+        projections = handler._try_api_access()
+    
+    assert [p["player_name"] for p in projections] == ["First Player", "Second Player"]
+    
+    # Each endpoint's response is saved to its own file, though both are "projections"
+    saved = {name: json.loads((tmp_path / "prizepicks" / name).read_bytes())
+             for name in ("api_response_1_projections.json", "api_response_4_projections.json")}
+    assert saved["api_response_1_projections.json"]["data"][0]["attributes"]["name"] == "First Player"
+    assert saved["api_response_4_projections.json"]["data"][0]["attributes"]["name"] == "Second Player"
+
+
+def test_bypass_requests_sent_concurrently(prizepicks_handler):
+    """Test that the /cookies and /html bypass requests are in flight together."""
+    barrier = threading.Barrier(2, timeout=5)
+    
+    def fake_get(url, **kwargs):
+        barrier.wait()
+        return MagicMock(status_code=200, text="<html></html>", content=b'{"cookies": {"cf_clearance": "token"}}')
+    
+    prizepicks_handler.bypass_server_running = True
+    with patch.object(prizepicks_handler.bypass_session, 'get', side_effect=fake_get), \
+         patch.object(prizepicks_handler, '_update_cookies_from_cloudflare_bypass') as mock_update:
+        html_content, cookies = prizepicks_handler._bypass_cloudflare()
+    
+    assert html_content == "<html></html>"
+    assert cookies == {"cf_clearance": "token"}
+    mock_update.assert_called_once_with({"cf_clearance": "token"})
+
+
+def test_html_fallback_only_fetched_when_api_fails(prizepicks_handler, sample_data):
+    """Test that the landing page is neither requested nor parsed when the API succeeds."""
+    with patch.object(prizepicks_handler, '_try_api_access', return_value=sample_data), \
+         patch.object(prizepicks_handler.session, 'get') as mock_get, \
+         patch.object(prizepicks_handler, '_enhanced_html_parsing') as mock_parse:
+        assert prizepicks_handler._scrape_prizepicks_data() == sample_data
+    mock_get.assert_not_called()
+    mock_parse.assert_not_called()
+    
+    with patch.object(prizepicks_handler, '_try_api_access', return_value=None), \
+         patch.object(prizepicks_handler, '_enhanced_html_parsing', return_value=sample_data) as mock_parse, \
+         patch.object(prizepicks_handler, '_selenium_scraping') as mock_selenium:
+        assert prizepicks_handler._scrape_prizepicks_data() == sample_data
+    mock_parse.assert_called_once_with()
+    mock_selenium.assert_not_called()
+
+
+def test_get_with_backoff_retries_transient_failures(prizepicks_handler):
+    """Test that rate limits and read timeouts are retried, and unreachable hosts are not."""
+    import requests
+    
+    limited = MagicMock(status_code=429, headers={"Retry-After": "2"})
+    ok = MagicMock(status_code=200, headers={})
+    side_effects = [limited, requests.exceptions.ReadTimeout(), ok]
+    
+    with patch.object(prizepicks_handler.session, 'get', side_effect=side_effects), \
+         patch('time.sleep') as mock_sleep:
+        response = prizepicks_handler._get_with_backoff("https://example.com", base=1.0, jitter=0.5)
+    
+    assert response is ok
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays[0] == 2.0
+    assert 2.0 <= delays[1] <= 3.0
+    
+    # Non-retryable statuses come straight back
+    missing = MagicMock(status_code=404, headers={})
+    with patch.object(prizepicks_handler.session, 'get', return_value=missing) as mock_get:
+        assert prizepicks_handler._get_with_backoff("https://example.com") is missing
+        assert mock_get.call_count == 1
+    
+    # Being offline fails on the first attempt
+    for error in (requests.exceptions.ConnectionError(), requests.exceptions.ConnectTimeout()):
+        with patch.object(prizepicks_handler.session, 'get', side_effect=error) as mock_get, \
+             patch('time.sleep') as mock_sleep:
+            with pytest.raises(requests.exceptions.ConnectionError):
+                prizepicks_handler._get_with_backoff("https://example.com")
+        assert mock_get.call_count == 1
+        mock_sleep.assert_not_called()
+
+
+def test_extract_json_from_html(prizepicks_handler):
+    """Test that projections embedded as page state in a script tag are extracted."""
+    html = (
+        '<html><body><div class="card">Not data</div>'
+        '<script>window.__INITIAL_STATE__ = {"projections": ['
+        '{"player": {"name": "Test Player"}, "team": "TST", "statType": "Points", "line": 20.5}'
+        '], "note": "ends with };"}; window.ready = function() { return {}; };</script></body></html>'
+    )
+    
+    projections = prizepicks_handler._extract_json_from_html(html)
+    
+    assert len(projections) == 1
+    assert projections[0]["player_name"] == "Test Player"
+    assert projections[0]["team"] == "TST"
+    assert projections[0]["projection_type"] == "Points"
+    assert projections[0]["line"] == 20.5
+
+
+def test_extract_json_from_html_keeps_lines_for_other_games(prizepicks_handler):
+    """Test that overlapping state paths add a line once, while a player's line for another game is kept."""
+    entries = (
+        '{"playerName": "Test Player", "statType": "Points", "line": 20.5, "gameTime": "2025-01-01T19:00:00"},'
+        '{"playerName": "Test Player", "statType": "Points", "line": 22.5, "gameTime": "2025-01-02T19:00:00"}'
+    )
+    html = (
+        '<script>window.__INITIAL_STATE__ = {"projections": [' + entries + '], '
+        '"data": {"projections": [' + entries + ']}};</script>'
+    )
+    
+    projections = prizepicks_handler._extract_json_from_html(html)
+    
+    assert [(p["line"], p["game_time"]) for p in projections] == [
+        (20.5, "2025-01-01T19:00:00"),
+        (22.5, "2025-01-02T19:00:00"),
+    ]
+
+
+def test_enhanced_html_parsing_visits_each_card_once(tmp_path):
+    """Test that a container matching several card selectors yields its cards once."""
+    handler = PrizePicksData(data_dir=str(tmp_path))
+    html = (
+        '<html><body><div class="grid flex">'
+        '<div><h3>Test Player</h3><span>20.5</span><span>Points</span></div>'
+        '<div><h3>Other Player</h3><span>6.5</span><span>Assists</span></div>'
+        '</div></body></html>'
+    )
+    
+    with patch.object(handler.session, 'get', return_value=MagicMock(text=html)):
+        projections = handler._enhanced_html_parsing()
+    
+    assert [(p["player_name"], p["projection_type"], p["line"]) for p in projections] == [
+        ("Test Player", "Points", 20.5),
+        ("Other Player", "Assists", 6.5),
+    ]
+    
+    # Parsing stops once max_projections have been found
+    handler.max_projections = 1
+    with patch.object(handler.session, 'get', return_value=MagicMock(text=html)):
+        assert len(handler._enhanced_html_parsing()) == 1
+
+
+def test_fallback_html_parsing_skips_duplicate_cards(tmp_path):
+    """Test that a container parsed both as a card and via its children adds each line once."""
+    handler = PrizePicksData(data_dir=str(tmp_path))
+    html = (
+        '<html><body><div class="flex">'
+        '<div><h3>Test Player</h3><span>Points</span><span>20.5</span></div>'
+        '<div><h3>Other Player</h3><span>Assists</span><span>6.5</span></div>'
+        '<div><h3>Third Player</h3><span>Rebounds</span><span>9.5</span></div>'
+        '</div></body></html>'
+    )
+    
+    with patch.object(handler.session, 'get', return_value=MagicMock(text=html)):
+        projections = handler._fallback_html_parsing()
+    
+    assert [(p["player_name"], p["projection_type"]) for p in projections] == [
+        ("Test Player", "Points"),
+        ("Other Player", "Assists"),
+        ("Third Player", "Rebounds"),
+    ]
+
+
+def test_captcha_poller_flags_late_captcha(prizepicks_handler):
+    """Test that the CAPTCHA check is throttled, reports a CAPTCHA and then stops probing."""
+    prizepicks_handler.captcha_poll_interval = 0.05
+    driver = MagicMock()
+    driver.execute_script.side_effect = [
+        {"hold": None, "checkbox": False, "frame": False, "text": False},
+        {"hold": None, "checkbox": False, "frame": True, "text": False},
+    ]
+    captcha_seen = prizepicks_handler._captcha_poller()
+    
+    assert not captcha_seen(driver)
+    assert not captcha_seen(driver)
+    assert driver.execute_script.call_count == 1
+    
+    time.sleep(0.06)
+    assert captcha_seen(driver)
+    time.sleep(0.06)
+    assert captcha_seen(driver)
+    assert driver.execute_script.call_count == 2
+    driver.switch_to.frame.assert_not_called()
+
+
+def test_non_numeric_lines_skipped(prizepicks_handler):
+    """Test that projections with a missing or non-numeric line are dropped instead of raising."""
+    data = {"projections": [
+        {"playerName": "Test Player", "statType": "Points", "line": 22.5},
+        {"playerName": "Other Player", "statType": "Assists", "line": "7"},
+        {"playerName": "Third Player", "statType": "Rebounds", "line": None},
+        {"playerName": "Fourth Player", "statType": "Steals", "line": "N/A"},
+    ]}
+    
+    projections = prizepicks_handler._process_json_object(data)
+    
+    assert [(p["player_name"], p["line"]) for p in projections] == [
+        ("Test Player", 22.5),
+        ("Other Player", 7.0),
+    ]